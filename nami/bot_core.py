@@ -1,8 +1,11 @@
 # Save as: nami/bot_core.py
 import os
 import yaml
+import functools
+import threading
 import vertexai
 import traceback
+from collections import deque
 from vertexai.generative_models import GenerativeModel, HarmCategory, HarmBlockThreshold, Part, Content, FunctionDeclaration, Tool
 from google.oauth2 import service_account
 from nami.config import TUNED_MODEL_ID
@@ -34,6 +37,55 @@ play_sound_effect_func = FunctionDeclaration(
 # Create the tool
 sound_effects_tool = Tool(function_declarations=[play_sound_effect_func])
 
+# Use the libyaml parser when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+@functools.lru_cache(maxsize=8)
+def _load_prompt_cached(path, mtime_ns):
+    """
+    Reads and parses the YAML prompt file. Keyed on mtime so edits are picked up.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        config = yaml.load(f, Loader=_SafeLoader)
+    prompt = config.get('SYSTEM', '')
+    if not prompt:
+        prompt = config
+    return prompt
+
+def _parse_project_location(model_id):
+    """
+    Splits projects/<project>/locations/<location>/... into (project, location).
+    Returns None if the ID isn't in that format.
+    """
+    parts = model_id.split('/')
+    if len(parts) < 4:
+        return None
+    return parts[1], parts[3]
+
+# Parsed once at import; None if TUNED_MODEL_ID is unset or malformed
+_PROJECT_LOCATION = _parse_project_location(TUNED_MODEL_ID) if TUNED_MODEL_ID else None
+
+# maxsize=1: vertexai.init sets global SDK state, so only the most recent
+# arguments may be treated as already applied
+@functools.lru_cache(maxsize=1)
+def _init_vertex(project_id, location, creds_path, creds_mtime_ns):
+    """
+    Loads the service account key and runs vertexai.init, skipping both when
+    called again with the same arguments. Failures are not cached.
+    """
+    try:
+        credentials = service_account.Credentials.from_service_account_file(creds_path)
+        print("Successfully loaded credentials from service account file.")
+    except Exception as e:
+        print(f"FATAL ERROR: Could not load credentials from {creds_path}. {e}")
+        raise
+
+    vertexai.init(project=project_id, location=location, credentials=credentials)
+    print("Vertex AI initialized successfully.")
+
 class NamiBot:
     def __init__(self, config_path=None):
         """
@@ -49,24 +101,19 @@ class NamiBot:
 
         self.system_prompt = self._load_system_prompt()
 
-        try:
-            parts = TUNED_MODEL_ID.split('/')
-            project_id = parts[1]
-            location = parts[3]
-            print(f"Parsed project: {project_id}, location: {location}")
-        except IndexError:
+        if _PROJECT_LOCATION is None:
             raise ValueError("TUNED_MODEL_ID in config.py is not in the expected format.")
+        project_id, location = _PROJECT_LOCATION
+        print(f"Parsed project: {project_id}, location: {location}")
 
         creds_path = os.path.join(os.path.dirname(__file__), 'gcp_creds.json')
         try:
-            credentials = service_account.Credentials.from_service_account_file(creds_path)
-            print("Successfully loaded credentials from service account file.")
-        except Exception as e:
+            creds_mtime_ns = os.stat(creds_path).st_mtime_ns
+        except OSError as e:
             print(f"FATAL ERROR: Could not load credentials from {creds_path}. {e}")
             raise
 
-        vertexai.init(project=project_id, location=location, credentials=credentials)
-        print("Vertex AI initialized successfully.")
+        _init_vertex(project_id, location, creds_path, creds_mtime_ns)
 
         self.safety_settings = {
             HarmCategory.HARM_CATEGORY_HARASSMENT: HarmBlockThreshold.BLOCK_NONE,
@@ -82,8 +129,8 @@ class NamiBot:
             safety_settings=self.safety_settings
         )
 
-        self.history = []
         self.max_history_length = 20
+        self.history = deque(maxlen=self.max_history_length)
 
         print(f"NamiBot initialization complete. Using model: {TUNED_MODEL_ID}")
 
@@ -92,13 +139,10 @@ class NamiBot:
         Loads the system prompt from the YAML configuration file.
         """
         try:
-            with open(self.config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-                prompt = config.get('SYSTEM', '')
-                if not prompt:
-                     prompt = config
-                print(f"Loaded system prompt from {self.config_path}")
-                return prompt
+            mtime_ns = os.stat(self.config_path).st_mtime_ns
+            prompt = _load_prompt_cached(self.config_path, mtime_ns)
+            print(f"Loaded system prompt from {self.config_path}")
+            return prompt
         except FileNotFoundError:
             print(f"Error: Config file not found at {self.config_path}")
             return "You are Nami, a helpful assistant."
@@ -106,6 +150,29 @@ class NamiBot:
             print(f"Error loading system prompt: {e}")
             return ""
 
+    def _remember_turn(self, prompt, nami_response):
+        """
+        Appends a user/model exchange to the history (oldest turns drop off automatically).
+        """
+        self.history.append(Content(role="user", parts=[Part.from_text(prompt)]))
+        self.history.append(Content(role="model", parts=[Part.from_text(nami_response)]))
+
+    def _format_context_for_ui(self, full_prompt):
+        """
+        Formats the history and the prompt for the UI debug panel.
+        """
+        history_lines = []
+        for entry in self.history:
+            role = "User" if entry.role == "user" else "Nami"
+            text = entry.parts[0].text.strip()
+            history_lines.append(f"{role}: {text}")
+        history_for_ui = "\n".join(history_lines)
+
+        return (
+            f"--- CONVERSATION HISTORY ---\n{history_for_ui}\n\n"
+            f"--- CURRENT CONTEXT & PROMPT ---\n{full_prompt}"
+        )
+
     def generate_response(self, prompt):
         """
         Generates a response. 
@@ -148,34 +215,20 @@ class NamiBot:
 
         full_prompt = f"{context_block}\n\nUSER INPUT: {prompt}"
 
-        # History formatting for UI debug
-        history_lines = []
-        for entry in self.history:
-            role = "User" if entry.role == "user" else "Nami"
-            text = entry.parts[0].text.strip()
-            history_lines.append(f"{role}: {text}")
-        history_for_ui = "\n".join(history_lines)
-
-        full_context_for_ui = (
-            f"--- CONVERSATION HISTORY ---\n{history_for_ui}\n\n"
-            f"--- CURRENT CONTEXT & PROMPT ---\n{full_prompt}"
-        )
-
         print(f"\n--- Sending Prompt to Gemini --- \n{full_prompt[:500]}...\n---------------------------------")
 
         try:
-            contents_for_api = self.history + [
+            contents_for_api = list(self.history) + [
                 Content(role="user", parts=[Part.from_text(full_prompt)])
             ]
 
             response = self.model.generate_content(contents_for_api)
             nami_response = response.text
 
-            self.history.append(Content(role="user", parts=[Part.from_text(prompt)]))
-            self.history.append(Content(role="model", parts=[Part.from_text(nami_response)]))
+            # Built after the request is sent, before this turn joins the history
+            full_context_for_ui = self._format_context_for_ui(full_prompt)
 
-            if len(self.history) > self.max_history_length:
-                self.history = self.history[-self.max_history_length:]
+            self._remember_turn(prompt, nami_response)
 
             print(f"\n--- Received Nami's Response ---\n{nami_response}\n----------------------------------")
             return nami_response, full_context_for_ui
@@ -184,19 +237,35 @@ class NamiBot:
             print(f"An error occurred while generating response. Full error details:")
             traceback.print_exc()
             print("="*51 + "\n")
+            full_context_for_ui = self._format_context_for_ui(full_prompt)
             return "Ugh, my circuits are sizzling. Give me a second and try that again.", full_context_for_ui
 
 if not TUNED_MODEL_ID:
     print("\n" + "="*50)
     print("FATAL ERROR: Please set TUNED_MODEL_ID in your config.py")
     print("="*50 + "\n")
-    nami_bot_instance = None
-else:
-    nami_bot_instance = NamiBot()
+
+# Built on first use so importing this module doesn't load creds or init Vertex
+_nami_bot_instance = None
+_nami_bot_lock = threading.Lock()
+
+def _get_bot():
+    """Returns the shared NamiBot, creating it on the first call."""
+    global _nami_bot_instance
+    if _nami_bot_instance is None:
+        with _nami_bot_lock:
+            if _nami_bot_instance is None:
+                _nami_bot_instance = NamiBot()
+    return _nami_bot_instance
+
+def warm_up_bot():
+    """Creates the bot ahead of the first question. Raises if the Vertex setup is broken."""
+    if TUNED_MODEL_ID:
+        _get_bot()
 
 def ask_question(question):
     """Wrapper function to call the bot's generate_response method."""
-    if nami_bot_instance:
-        return nami_bot_instance.generate_response(question)
+    if TUNED_MODEL_ID:
+        return _get_bot().generate_response(question)
     else:
-        return "NamiBot is not initialized. Please check your config."
\ No newline at end of file
+        return "NamiBot is not initialized. Please check your config."
@@ -5,6 +5,10 @@ from typing import List, Dict, Any, Union
 # The port for the director_engine
 DIRECTOR_URL = "http://localhost:8002"
 
+# One keep-alive client for every turn instead of a new connection per call.
+# Increased timeout since construct_context_block is async and may do Gemini calls
+_director_client = httpx.Client(timeout=10.0)
+
 def get_breadcrumbs_from_director(count: int = 3) -> Union[Dict[str, Any], List]:
     """
     Fetches the formatted context block from the director_engine (Brain 1).
@@ -17,8 +21,7 @@ def get_breadcrumbs_from_director(count: int = 3) -> Union[Dict[str, Any], List]
         Empty list on failure
     """
     try:
-        # Increased timeout since construct_context_block is async and may do Gemini calls
-        response = httpx.get(f"{DIRECTOR_URL}/breadcrumbs?count={count}", timeout=10.0)
+        response = _director_client.get(f"{DIRECTOR_URL}/breadcrumbs", params={"count": count})
         
         if response.status_code == 200:
             data = response.json()
@@ -1,7 +1,6 @@
 # Save as: nami/director_connector.py
 import socketio
 import threading
-import time
 import httpx
 from typing import Dict, Any, Optional
 
@@ -20,7 +19,8 @@ sio = socketio.Client(
 
 connector_thread = None
 is_running = False
-connection_lock = threading.Lock()
+# Set by stop_connector() so every wait in run_connector() wakes immediately
+stop_event = threading.Event()
 
 @sio.event
 def connect():
@@ -38,14 +38,14 @@ def run_connector():
     """Runs the Socket.IO client in a persistent loop with better error handling."""
     global is_running
     is_running = True
+    stop_event.clear()
     consecutive_failures = 0
     
     while is_running:
         try:
-            with connection_lock:
-                if sio.connected:
-                    time.sleep(1)
-                    continue
+            if sio.connected:
+                stop_event.wait(1)
+                continue
             
             print(f"[DirectorConnector] Attempting to connect to {DIRECTOR_URL}...")
             
@@ -57,7 +57,7 @@ def run_connector():
             consecutive_failures = 0
             
             while is_running and sio.connected:
-                time.sleep(1)
+                stop_event.wait(1)
                 
         except socketio.exceptions.ConnectionError as e:
             consecutive_failures += 1
@@ -65,15 +65,12 @@ def run_connector():
             print(f"[DirectorConnector] Connection error (attempt {consecutive_failures}): {e}")
             print(f"[DirectorConnector] Retrying in {wait_time}s...")
             
-            for _ in range(wait_time * 2):
-                if not is_running:
-                    break
-                time.sleep(0.5)
+            stop_event.wait(wait_time)
                 
         except Exception as e:
             consecutive_failures += 1
             print(f"[DirectorConnector] Unexpected error: {type(e).__name__}: {e}")
-            time.sleep(5)
+            stop_event.wait(5)
 
 def start_connector_thread():
     """Starts the connector in a background daemon thread."""
@@ -87,6 +84,7 @@ def stop_connector():
     """Stops the Socket.IO client."""
     global is_running
     is_running = False
+    stop_event.set()
     
     try:
         if sio.connected:
@@ -109,15 +107,17 @@ def _safe_emit(event: str, payload: dict) -> bool:
         print(f"[DirectorConnector] Error emitting '{event}': {e}")
         return False
 
+# Shared so repeated fallbacks reuse the same keep-alive connection
+_fallback_client = httpx.Client(timeout=2.0)
+
 def _http_fallback(url: str, payload: dict = None, method: str = "POST") -> bool:
     """HTTP fallback for any URL."""
     try:
-        with httpx.Client(timeout=2.0) as client:
-            if method == "POST":
-                response = client.post(url, json=payload or {})
-            else:
-                response = client.get(url)
-            return response.status_code == 200
+        if method == "POST":
+            response = _fallback_client.post(url, json=payload or {})
+        else:
+            response = _fallback_client.get(url)
+        return response.status_code == 200
     except Exception as e:
         print(f"[DirectorConnector] HTTP fallback failed for {url}: {e}")
         return False
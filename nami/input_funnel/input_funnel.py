@@ -29,6 +29,8 @@ class InputFunnel:
         self.input_queue = PriorityQueue()
         self.processing = False
         self.shutdown_requested = False
+        # Set by stop() so rate-limit waits end immediately on shutdown
+        self.shutdown_event = threading.Event()
         self.processing_lock = threading.Lock()
         self.last_prompt_time = 0
         self.min_prompt_interval = min_prompt_interval
@@ -96,10 +98,7 @@ class InputFunnel:
                 time_since_last = time.time() - self.last_prompt_time
                 if time_since_last < self.min_prompt_interval:
                     sleep_time = self.min_prompt_interval - time_since_last
-                    end_time = time.time() + sleep_time
-                    while time.time() < end_time and not self.shutdown_requested:
-                        time.sleep(0.1)
-                    if self.shutdown_requested:
+                    if self.shutdown_event.wait(sleep_time):
                         self.input_queue.task_done()
                         break
                 
@@ -157,6 +156,7 @@ class InputFunnel:
         """Stop the funnel processing"""
         print("InputFunnel shutdown requested")
         self.shutdown_requested = True
+        self.shutdown_event.set()
         
         # Wait for processing thread to exit
         if self.processing_thread and self.processing_thread.is_alive():
@@ -3,7 +3,6 @@ from .priority_core import PrioritySystem, InputSource, ConversationState, Input
 from .priority_integration import (
     init_priority_system,
     shutdown_priority_system,
-    process_console_command,
     set_conversation_state,
     response_handler # Expose the response handler for direct access
 )
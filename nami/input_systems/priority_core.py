@@ -2,6 +2,7 @@
 import time
 import threading
 import queue
+from collections import deque
 from dataclasses import dataclass
 from enum import Enum, auto
 from typing import Dict, Optional, Any, Callable
@@ -53,8 +54,8 @@ class PrioritySystem:
         
         self.current_state = ConversationState.IDLE
         self.last_response_time = 0
-        self.recent_inputs = []
         self.max_recent_inputs = 10
+        self.recent_inputs = deque(maxlen=self.max_recent_inputs)
         
         self.input_queue = queue.PriorityQueue()
         self.processing = False
@@ -72,7 +73,11 @@ class PrioritySystem:
         thread.start()
     
     def stop_processing(self):
+        if not self.processing:
+            return
         self.processing = False
+        # Sorts ahead of every real input and wakes the blocked worker
+        self.input_queue.put((float('-inf'), 0, None))
     
     def set_state(self, state: ConversationState):
         self.current_state = state
@@ -91,8 +96,6 @@ class PrioritySystem:
         
         with self.queue_lock:
             self.recent_inputs.append(item)
-            if len(self.recent_inputs) > self.max_recent_inputs:
-                self.recent_inputs.pop(0)
         
         # Only queue direct interactions for a potential response.
         # General chat will now only serve as context.
@@ -108,26 +111,23 @@ class PrioritySystem:
     
     def _process_queue(self):
         """Processes DIRECT inputs only. Ambient inputs are now context-only."""
-        while self.processing:
+        # Exits only on the sentinel so stop_processing() never leaves it queued
+        while True:
             try:
-                if self.input_queue.empty():
-                    time.sleep(0.1)
-                    continue
-                
+                # Sleeps until an input arrives or stop_processing() wakes us
+                _, _, item = self.input_queue.get()
+                if item is None:
+                    self.input_queue.task_done()
+                    break
+
                 current_threshold = self.thresholds[self.current_state]
-                _, _, item = self.input_queue.get(block=False)
-                
                 if item.score >= current_threshold:
                     if self.response_callback:
                         self.response_callback(item)
                         self.last_response_time = time.time()
-                
+
                 self.input_queue.task_done()
-                # --- MODIFIED: Reduced sleep time for faster queue processing ---
-                time.sleep(0.1)
-                
-            except queue.Empty:
-                time.sleep(0.1)
+
             except Exception as e:
                 print(f"Error in priority queue processing: {e}")
                 time.sleep(1)
\ No newline at end of file
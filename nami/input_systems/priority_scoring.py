@@ -36,7 +36,8 @@ def _is_continuation(item, recent_inputs) -> bool:
         
     # Check if this input contains words from recent inputs
     recent_words = set()
-    for recent in recent_inputs[-3:]:  # Look at last 3 inputs
+    # list() snapshots the deque so a concurrent add_input can't break iteration
+    for recent in list(recent_inputs)[-3:]:  # Look at last 3 inputs
         for word in recent.text.lower().split():
             if len(word) > 4:  # Only consider substantial words
                 recent_words.add(word)
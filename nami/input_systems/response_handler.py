@@ -1,4 +1,5 @@
 import time
+from collections import deque
 from nami.bot_core import ask_question
 from nami.input_systems.priority_core import InputItem, InputSource
 
@@ -10,9 +11,9 @@ class ResponseHandler:
         self.use_bot_core = True
         # Callback for sending to Twitch
         self.twitch_send_callback = None
-        # Recent responses for deduplication
-        self._recent_responses = []
+        # Recent responses for deduplication (oldest drop off automatically)
         self._max_responses = 15
+        self._recent_responses = deque(maxlen=self._max_responses)
     
     def set_llm_callback(self, callback):
         """Set the callback function for getting responses from the LLM"""
@@ -82,10 +83,6 @@ class ResponseHandler:
             item.text[:50].lower().strip(),
             time.time()
         ))
-        
-        # Only keep the most recent responses
-        if len(self._recent_responses) > self._max_responses:
-            self._recent_responses.pop(0)
     
     def _format_input(self, item: InputItem) -> str:
         """Format the input appropriately based on source"""
@@ -11,10 +11,11 @@ import threading
 import os
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
 
 from nami.input_systems.priority_core import ConversationState
-from nami.bot_core import ask_question, BOTNAME
+from nami.bot_core import ask_question, warm_up_bot, BOTNAME
 from nami.input_systems import (
     init_priority_system,
     shutdown_priority_system,
@@ -39,6 +40,19 @@ global_input_funnel = None
 
 TTS_SERVICE_URL = "http://localhost:8004"
 
+# Keep-alive sessions for the TTS service, one per thread: requests doesn't
+# guarantee Session is thread-safe, and /stop and /health run on other
+# threads while /speak is still blocked on playback.
+_tts_local = threading.local()
+
+def _tts_session() -> requests.Session:
+    session = getattr(_tts_local, "session", None)
+    if session is None:
+        session = requests.Session()
+        session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+        _tts_local.session = session
+    return session
+
 # Thread-safe event to prevent Nami from talking over herself
 nami_is_busy = threading.Event()
 nami_is_busy.clear()
@@ -52,7 +66,7 @@ def _tts_speak(text: str, source: str):
     Runs in its own daemon thread — clears nami_is_busy when done.
     """
     try:
-        requests.post(
+        _tts_session().post(
             f"{TTS_SERVICE_URL}/speak",
             json={"text": text, "source": source},
             timeout=120,   # long enough for slow TTS + lengthy responses
@@ -69,14 +83,14 @@ def _tts_speak(text: str, source: str):
 def _tts_stop():
     """Tell the TTS service to kill current playback."""
     try:
-        requests.post(f"{TTS_SERVICE_URL}/stop", timeout=3)
+        _tts_session().post(f"{TTS_SERVICE_URL}/stop", timeout=3)
     except Exception as e:
         print(f"⚠️  [Nami] TTS stop failed: {e}")
 
 
 def _tts_available() -> bool:
     try:
-        r = requests.get(f"{TTS_SERVICE_URL}/health", timeout=2)
+        r = _tts_session().get(f"{TTS_SERVICE_URL}/health", timeout=2)
         return r.status_code == 200
     except Exception:
         return False
@@ -255,6 +269,10 @@ def main():
     print("🌊 NAMI — Starting Up...")
     print("=" * 60)
 
+    # 0. Build the bot now so bad creds / TUNED_MODEL_ID / Vertex init stop
+    #    startup before the launcher sees port 8000 as healthy
+    warm_up_bot()
+
     # 1. Interjection server — port 8000 (launcher health-checks this)
     _start_interjection_server()
 
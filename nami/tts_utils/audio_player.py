@@ -1,6 +1,7 @@
 import sounddevice as sd
 import soundfile as sf
 import os
+from math import gcd
 from .voice_config import PREFERRED_SPEAKER_ID
 
 def play_audio_file(filename, device_id=PREFERRED_SPEAKER_ID):
@@ -18,7 +19,8 @@ def play_audio_file(filename, device_id=PREFERRED_SPEAKER_ID):
             return False
             
         print(f"🔊 Playing through device ID {device_id}: {device_info['name']}")
-        data, samplerate = sf.read(filename)
+        # float32 is all sounddevice needs - halves the buffer vs the float64 default
+        data, samplerate = sf.read(filename, dtype='float32')
         
         # Calculate expected duration for logging
         duration_seconds = len(data) / samplerate
@@ -29,9 +31,12 @@ def play_audio_file(filename, device_id=PREFERRED_SPEAKER_ID):
             print(f"ℹ️ Resampling audio from {samplerate}Hz to {device_info['default_samplerate']}Hz")
             try:
                 from scipy import signal
-                new_length = int(len(data) * device_info['default_samplerate'] / samplerate)
-                data = signal.resample(data, new_length)
-                samplerate = device_info['default_samplerate']
+                # Polyphase FIR runs in linear time; FFT resample of a whole
+                # clip is O(n log n) and crawls when n has large prime factors
+                target_rate = int(device_info['default_samplerate'])
+                factor = gcd(int(samplerate), target_rate)
+                data = signal.resample_poly(data, target_rate // factor, int(samplerate) // factor, axis=0)
+                samplerate = target_rate
             except ImportError:
                 print("⚠️ scipy not available, audio quality may be affected")
 
@@ -17,23 +17,37 @@ def load_banned_words():
         print("⚠️ Warning: Could not load banned words list")
         return []
 
+def build_banned_pattern(banned_words):
+    """
+    Compile the banned list into a single alternation so a response is
+    scanned once instead of once per banned word.
+    Phrases match anywhere, single words only on word boundaries.
+    Returns None if the list is empty.
+    """
+    if not banned_words:
+        return None
+
+    alternatives = []
+    # Longest first so e.g. "bad phrase" wins over "bad" at the same position
+    for banned_word in sorted(set(banned_words), key=len, reverse=True):
+        if ' ' in banned_word:
+            alternatives.append(re.escape(banned_word))
+        else:
+            alternatives.append(r'\b' + re.escape(banned_word) + r'\b')
+    return re.compile('|'.join(alternatives))
+
+# Built once at import - the banned list doesn't change at runtime
+BANNED_PATTERN = build_banned_pattern(load_banned_words())
+
 def contains_banned_content(text):
     """Checks for banned words and returns (is_banned, trigger_word)"""
-    if not text:
+    if not text or BANNED_PATTERN is None:
         return False, None
-        
-    banned_words = load_banned_words()
-    text_lower = text.lower()
-    
-    for banned_word in banned_words:
-        if ' ' in banned_word:
-            if banned_word in text_lower:
-                return True, banned_word 
-        else:
-            pattern = r'\b' + re.escape(banned_word) + r'\b'
-            if re.search(pattern, text_lower):
-                return True, banned_word
-    
+
+    match = BANNED_PATTERN.search(text.lower())
+    if match:
+        return True, match.group(0)
+
     return False, None
 
 def get_censored_versions(original_text):
@@ -4,7 +4,6 @@ import azure.cognitiveservices.speech as speechsdk
 from xml.sax.saxutils import escape
 import tempfile
 import os
-import re
 from .voice_config import (
     AZURE_SPEECH_KEY,
     AZURE_SPEECH_REGION,
@@ -14,6 +13,7 @@ from .voice_config import (
     DEFAULT_PITCH,
     DEFAULT_RATE
 )
+from .text_utils import EFFECT_MARKER_PATTERN
 
 # Sound effect URL base - serving locally from your UI server
 SOUND_EFFECTS_BASE_URL = "http://localhost:8002/audio_effects"
@@ -43,8 +43,7 @@ def process_sound_effects(text):
             return match.group(0)
     
     # Find *EFFECTNAME* patterns and replace with SSML audio tags
-    pattern = r'\*([A-Za-z]+)\*'
-    processed_text = re.sub(pattern, replace_effect, text)
+    processed_text = EFFECT_MARKER_PATTERN.sub(replace_effect, text)
     
     return processed_text
 
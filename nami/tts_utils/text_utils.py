@@ -2,6 +2,11 @@
 
 import re
 
+# Compiled once at import. EFFECT_MARKER_PATTERN is shared with tts_engine and sfx_player
+EFFECT_MARKER_PATTERN = re.compile(r'\*([A-Za-z]+)\*')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+SPACE_BEFORE_PUNCTUATION_PATTERN = re.compile(r'\s+([,.!?;:])')
+
 def strip_sound_effects(text):
     """
     Remove sound effect markers from text for Twitch chat display.
@@ -17,14 +22,13 @@ def strip_sound_effects(text):
         Output: "Here is your stupid airhorn , okay?"
     """
     # Remove *EFFECTNAME* patterns
-    pattern = r'\*[A-Za-z]+\*'
-    cleaned_text = re.sub(pattern, '', text)
+    cleaned_text = EFFECT_MARKER_PATTERN.sub('', text)
     
     # Clean up multiple spaces that might be left behind
-    cleaned_text = re.sub(r'\s+', ' ', cleaned_text)
+    cleaned_text = WHITESPACE_PATTERN.sub(' ', cleaned_text)
     
     # Clean up spaces before punctuation
-    cleaned_text = re.sub(r'\s+([,.!?;:])', r'\1', cleaned_text)
+    cleaned_text = SPACE_BEFORE_PUNCTUATION_PATTERN.sub(r'\1', cleaned_text)
     
     return cleaned_text.strip()
 
@@ -38,8 +42,7 @@ def has_sound_effects(text):
     Returns:
         bool: True if text contains sound effect markers
     """
-    pattern = r'\*[A-Za-z]+\*'
-    return bool(re.search(pattern, text))
+    return bool(EFFECT_MARKER_PATTERN.search(text))
 
 def get_sound_effects_from_text(text):
     """
@@ -55,8 +58,7 @@ def get_sound_effects_from_text(text):
         Input:  "That was *AIRHORN* amazing *BONK*!"
         Output: ['AIRHORN', 'BONK']
     """
-    pattern = r'\*([A-Za-z]+)\*'
-    matches = re.findall(pattern, text)
+    matches = EFFECT_MARKER_PATTERN.findall(text)
     return [match.upper() for match in matches]
 
 # Test function
@@ -2,7 +2,6 @@ import azure.cognitiveservices.speech as speechsdk
 from xml.sax.saxutils import escape
 import tempfile
 import os
-import re
 import requests
 from .voice_config import (
     AZURE_SPEECH_KEY,
@@ -13,6 +12,7 @@ from .voice_config import (
     DEFAULT_PITCH,
     DEFAULT_RATE
 )
+from .text_utils import EFFECT_MARKER_PATTERN
 
 # --- DYNAMIC URL RESOLUTION ---
 def get_sound_effects_base_url():
@@ -55,8 +55,13 @@ SOUND_EFFECT_MAP = {
 def process_sound_effects(text):
     """
     Process text to convert *EFFECTNAME* markers into SSML audio tags.
-    Dynamically resolves the base URL each time.
+    Text without markers is returned as is; otherwise the base URL is
+    resolved fresh on each call.
     """
+    # Nothing to substitute - don't probe ngrok for a URL we won't use
+    if not EFFECT_MARKER_PATTERN.search(text):
+        return text
+
     # Get fresh URL each time in case ngrok changed
     current_base_url = get_sound_effects_base_url()
     
@@ -72,8 +77,7 @@ def process_sound_effects(text):
             return match.group(0)
     
     # Find *EFFECTNAME* patterns and replace with SSML audio tags
-    pattern = r'\*([A-Za-z]+)\*'
-    processed_text = re.sub(pattern, replace_effect, text)
+    processed_text = EFFECT_MARKER_PATTERN.sub(replace_effect, text)
     
     return processed_text
 